@@ -2,6 +2,7 @@
 """
 Script that provides statistics about Nginx logs stored in MongoDB
 """
+import sys
 from pymongo import MongoClient
 
 
@@ -15,23 +16,39 @@ def print_nginx_stats():
     # Get the logs database and nginx collection
     collection = client.logs.nginx
 
+    # Count every method and the status checks in a single server-side pass
+    pipeline = [
+        {
+            "$group": {
+                "_id": "$method",
+                "count": {"$sum": 1},
+                "status": {
+                    "$sum": {
+                        "$cond": [{"$eq": ["$path", "/status"]}, 1, 0]
+                    }
+                },
+            }
+        },
+    ]
+    groups = {doc["_id"]: doc for doc in collection.aggregate(pipeline)}
+
     # Get total number of documents
-    total_logs = collection.count_documents({})
-    print(f"{total_logs} logs")
+    total_logs = sum(doc["count"] for doc in groups.values())
+    lines = [f"{total_logs} logs"]
 
-    # Print methods statistics
-    print("Methods:")
+    # Methods statistics
+    lines.append("Methods:")
     methods = ["GET", "POST", "PUT", "PATCH", "DELETE"]
     for method in methods:
-        count = collection.count_documents({"method": method})
-        print(f"    method {method}: {count}")
+        count = groups.get(method, {}).get("count", 0)
+        lines.append(f"    method {method}: {count}")
 
     # Get status check count
-    status_check = collection.count_documents({
-        "method": "GET",
-        "path": "/status"
-    })
-    print(f"{status_check} status check")
+    status_check = groups.get("GET", {}).get("status", 0)
+    lines.append(f"{status_check} status check")
+
+    # Write the whole report at once
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
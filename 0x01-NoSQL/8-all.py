@@ -8,4 +8,4 @@ def list_all(mongo_collection):
     """
     Lists all documents in a collection.
     """
-    return [doc for doc in mongo_collection.find()]
+    return list(mongo_collection.find())
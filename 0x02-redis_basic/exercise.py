@@ -7,12 +7,41 @@ This module provides a Cache class and supporting decorators for:
 - Tracking method calls and their history
 - Converting data between different formats
 """
+import base64
+import os
+import sys
 import uuid
 import redis
 from functools import wraps
 from typing import Any, Callable, Union
 
 
+class _WorkerConnection(redis.Connection):
+    """
+    A Redis connection named after the process that opens it.
+
+    The name is resolved on every connect rather than at import time,
+    so each forked worker shows up under its own pid in CLIENT LIST.
+    """
+
+    def on_connect(self) -> None:
+        """
+        Set the connection's client name before the connect handshake.
+        """
+        self.client_name = 'exercise:{}'.format(os.getpid())
+        super().on_connect()
+
+
+redis_pool = redis.BlockingConnectionPool(
+    connection_class=_WorkerConnection,
+    max_connections=32,
+    timeout=5,
+)
+"""
+The connection pool shared by every Cache instance (at most 32 clients).
+"""
+
+
 def count_calls(method: Callable) -> Callable:
     """
     Decorator that tracks the number of calls made to a Cache class method.
@@ -25,8 +54,11 @@ def count_calls(method: Callable) -> Callable:
 
     Note:
         Uses Redis to maintain a persistent call count using the method's
-        qualified name as the key
+        qualified name as the key. The decorated method's instance must
+        expose a redis.Redis client as self._redis
     """
+    key = method.__qualname__
+
     @wraps(method)
     def invoker(self, *args, **kwargs) -> Any:
         """
@@ -39,8 +71,7 @@ def count_calls(method: Callable) -> Callable:
         Returns:
             Any: The result of the wrapped method
         """
-        if isinstance(self._redis, redis.Redis):
-            self._redis.incr(method.__qualname__)
+        self._redis.incr(key)
         return method(self, *args, **kwargs)
     return invoker
 
@@ -51,6 +82,8 @@ def call_history(method: Callable) -> Callable:
 
     This decorator stores both the inputs and outputs of the wrapped method
     in Redis lists using the method's qualified name as a base for the keys.
+    The decorated method's instance must expose a redis.Redis client as
+    self._redis.
 
     Args:
         method: The method to be decorated
@@ -58,6 +91,10 @@ def call_history(method: Callable) -> Callable:
     Returns:
         Callable: The wrapped method with call history tracking
     """
+    key = method.__qualname__
+    in_key = '{}:inputs'.format(key)
+    out_key = '{}:outputs'.format(key)
+
     @wraps(method)
     def invoker(self, *args, **kwargs) -> Any:
         """
@@ -70,13 +107,56 @@ def call_history(method: Callable) -> Callable:
         Returns:
             Any: The result of the wrapped method
         """
-        in_key = '{}:inputs'.format(method.__qualname__)
-        out_key = '{}:outputs'.format(method.__qualname__)
-        if isinstance(self._redis, redis.Redis):
-            self._redis.rpush(in_key, str(args))
+        self._redis.rpush(in_key, str(args))
         output = method(self, *args, **kwargs)
-        if isinstance(self._redis, redis.Redis):
-            self._redis.rpush(out_key, output)
+        self._redis.rpush(out_key, output)
+        return output
+    return invoker
+
+
+def track_calls(method: Callable) -> Callable:
+    """
+    Decorator that combines @count_calls and @call_history.
+
+    The call counter and the input and output histories are written
+    in a single pipelined round trip once the method has returned,
+    instead of one round trip per Redis command. A call that raises
+    is still counted and has its input recorded, as with the separate
+    decorators, but no output is pushed. The decorated method's instance
+    must expose a redis.Redis client as self._redis.
+
+    Args:
+        method: The method to be decorated
+
+    Returns:
+        Callable: The wrapped method with call counting and history tracking
+    """
+    key = method.__qualname__
+    in_key = '{}:inputs'.format(key)
+    out_key = '{}:outputs'.format(key)
+
+    @wraps(method)
+    def invoker(self, *args, **kwargs) -> Any:
+        """
+        Wrapper that counts the call and stores its inputs and outputs.
+
+        Args:
+            *args: Positional arguments to pass to the wrapped method
+            **kwargs: Keyword arguments to pass to the wrapped method
+
+        Returns:
+            Any: The result of the wrapped method
+        """
+        with self._redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.rpush(in_key, str(args))
+            try:
+                output = method(self, *args, **kwargs)
+            except BaseException:
+                pipe.execute()
+                raise
+            pipe.rpush(out_key, output)
+            pipe.execute()
         return output
     return invoker
 
@@ -93,7 +173,8 @@ def replay(fn: Callable) -> None:
         fn: The method whose call history should be displayed
 
     Note:
-        The method must be decorated with @call_history to track calls
+        The method must be decorated with @call_history or @track_calls
+        to track calls
         Prints the results in the format: '{fn_name}(*{args}) -> {output}'
     """
     if fn is None or not hasattr(fn, '__self__'):
@@ -104,18 +185,24 @@ def replay(fn: Callable) -> None:
     fxn_name = fn.__qualname__
     in_key = '{}:inputs'.format(fxn_name)
     out_key = '{}:outputs'.format(fxn_name)
-    fxn_call_count = 0
-    if redis_store.exists(fxn_name) != 0:
-        fxn_call_count = int(redis_store.get(fxn_name))
-    print('{} was called {} times:'.format(fxn_name, fxn_call_count))
-    fxn_inputs = redis_store.lrange(in_key, 0, -1)
-    fxn_outputs = redis_store.lrange(out_key, 0, -1)
-    for fxn_input, fxn_output in zip(fxn_inputs, fxn_outputs):
-        print('{}(*{}) -> {}'.format(
+    with redis_store.pipeline(transaction=False) as pipe:
+        pipe.get(fxn_name)
+        pipe.lrange(in_key, 0, -1)
+        pipe.lrange(out_key, 0, -1)
+        fxn_call_count, fxn_inputs, fxn_outputs = pipe.execute()
+    lines = ['{} was called {} times:'.format(
+        fxn_name,
+        int(fxn_call_count) if fxn_call_count else 0,
+    )]
+    lines.extend(
+        '{}(*{}) -> {}'.format(
             fxn_name,
-            fxn_input.decode("utf-8"),
-            fxn_output,
-        ))
+            fxn_input.decode('utf-8'),
+            fxn_output.decode('utf-8'),
+        )
+        for fxn_input, fxn_output in zip(fxn_inputs, fxn_outputs)
+    )
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 class Cache:
@@ -136,14 +223,13 @@ class Cache:
         """
         Initialize a new Cache instance.
 
-        Creates a new Redis client connection and clears any existing data
-        in the Redis database to ensure a clean state.
+        Creates a new Redis client on the shared connection pool and clears
+        any existing data in the Redis database to ensure a clean state.
         """
-        self._redis = redis.Redis()
+        self._redis = redis.Redis(connection_pool=redis_pool)
         self._redis.flushdb(True)
 
-    @call_history
-    @count_calls
+    @track_calls
     def store(self, data: Union[str, bytes, int, float]) -> str:
         """
         Store data in Redis and return a unique identifier.
@@ -152,13 +238,16 @@ class Cache:
             data: The data to store (can be string, bytes, int, or float)
 
         Returns:
-            str: A unique key (UUID) that can be used to retrieve the data
+            str: A unique key (a URL-safe base64 encoded UUID) that can be
+            used to retrieve the data
 
         Note:
-            This method is decorated with @call_history and @count_calls
-            to track its usage
+            This method is decorated with @track_calls, which counts
+            calls and records their history in a single round trip
         """
-        data_key = str(uuid.uuid4())
+        data_key = base64.urlsafe_b64encode(
+            uuid.uuid4().bytes
+        ).rstrip(b'=').decode('ascii')
         self._redis.set(data_key, data)
         return data_key
 
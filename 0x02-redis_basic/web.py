@@ -6,17 +6,45 @@ This module provides tools for:
 - Caching HTTP request responses
 - Tracking request counts per URL
 - Automatic cache expiration
-- Efficient response retrieval
+- Efficient response retrieval, including batched lookups
 
 The module maintains a Redis instance for storing both cache data
 and request metrics.
 """
+import os
 import redis
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Callable
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, Optional
 
-redis_store = redis.Redis()
+
+class _WorkerConnection(redis.Connection):
+    """
+    A Redis connection that identifies its worker in CLIENT LIST.
+    """
+
+    def on_connect(self) -> None:
+        """
+        Name the connection after the current (possibly forked) process.
+        """
+        self.client_name = f'web:{os.getpid()}'
+        super().on_connect()
+
+
+redis_pool = redis.BlockingConnectionPool(
+    connection_class=_WorkerConnection,
+    max_connections=32,
+    timeout=5,
+)
+"""
+The module-level pool backing redis_store, blocking once 32
+connections are in use.
+"""
+
+redis_store = redis.Redis(connection_pool=redis_pool)
 """
 The module-level Redis instance used for caching and tracking.
 This instance handles both storing cached responses
@@ -24,6 +52,62 @@ and maintaining request counts.
 """
 
 
+def _make_session() -> requests.Session:
+    """
+    Build an HTTP session that pools keep-alive connections per host.
+
+    Returns:
+        requests.Session: A session with pooled http and https adapters
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+http_session = _make_session()
+"""
+The module-level HTTP session used to fetch pages.
+Keep-alive connections are pooled per host so repeated cache misses
+reuse an open connection instead of paying a new TCP/TLS handshake.
+"""
+
+_fetch_pool = ThreadPoolExecutor(
+    max_workers=32,
+    thread_name_prefix='get_pages',
+)
+"""
+The module-level thread pool that fetches get_pages' cache misses.
+Its worker threads outlive each call, so their sessions keep
+connections alive between batches.
+"""
+
+_thread_sessions = threading.local()
+"""
+Per-thread HTTP sessions used by the fetch workers, since requests
+does not guarantee a Session is safe to share across threads.
+"""
+
+_lookup_script = redis_store.register_script(
+    "local count = redis.call('INCR', KEYS[1]) "
+    "return {count, redis.call('GET', KEYS[2])}"
+)
+"""
+Lua script that increments the request counter and reads the cached
+response atomically, in a single round trip (loaded once, run via EVALSHA).
+"""
+
+_store_script = redis_store.register_script(
+    "redis.call('SET', KEYS[1], 0) "
+    "redis.call('SETEX', KEYS[2], ARGV[1], ARGV[2])"
+)
+"""
+Lua script that resets the request counter and caches a fresh response
+with its expiration time atomically, in a single round trip.
+"""
+
+
 def data_cacher(method: Callable) -> Callable:
     """
     Decorator that implements caching for HTTP request methods.
@@ -51,10 +135,11 @@ def data_cacher(method: Callable) -> Callable:
         Wrapper function that implements the caching mechanism.
 
         This function:
-        1. Increments the request counter for the URL
-        2. Checks for cached response
-        3. Returns cached response if available
-        4. Fetches and caches new response if needed
+        1. Increments the request counter and checks for a cached
+           response in a single atomic script call
+        2. Returns cached response if available
+        3. Fetches and caches new response if needed, resetting
+           the counter and writing the cache in a single script call
 
         Args:
             url: The URL to fetch and cache
@@ -65,24 +150,64 @@ def data_cacher(method: Callable) -> Callable:
         Note:
             Cache entries expire after 10 seconds to ensure content freshness
         """
-        redis_store.incr(f'count:{url}')
-        result = redis_store.get(f'result:{url}')
+        count_key = f'count:{url}'
+        result_key = f'result:{url}'
+        _, result = _lookup_script(keys=[count_key, result_key])
         if result:
             return result.decode('utf-8')
         result = method(url)
-        redis_store.set(f'count:{url}', 0)
-        redis_store.setex(f'result:{url}', 10, result)
+        _store_script(keys=[count_key, result_key], args=[10, result])
         return result
     return invoker
 
 
+def _thread_session() -> requests.Session:
+    """
+    Return the calling thread's own pooled HTTP session.
+
+    Returns:
+        requests.Session: A session created on first use in this thread
+    """
+    session = getattr(_thread_sessions, 'session', None)
+    if session is None:
+        session = _thread_sessions.session = _make_session()
+    return session
+
+
+def _fetch(url: str, session: requests.Session = http_session) -> str:
+    """
+    Fetch the content of a URL without any caching.
+
+    Args:
+        url: The URL to fetch
+        session: The HTTP session to send the request through
+
+    Returns:
+        str: The text content of the URL response
+    """
+    return session.get(url, timeout=5).text
+
+
+def _fetch_in_thread(url: str) -> str:
+    """
+    Fetch the content of a URL through the calling thread's session.
+
+    Args:
+        url: The URL to fetch
+
+    Returns:
+        str: The text content of the URL response
+    """
+    return _fetch(url, _thread_session())
+
+
 @data_cacher
 def get_page(url: str) -> str:
     """
     Fetch and cache the content of a URL.
 
     This function:
-    - Retrieves the content of the specified URL
+    - Retrieves the content of the specified URL over a pooled session
     - Caches the response for future requests
     - Tracks the number of times the URL is requested
     - Provides automatic cache expiration
@@ -98,4 +223,64 @@ def get_page(url: str) -> str:
         - Request counts are maintained per URL
         - Responses are cached as UTF-8 encoded strings
     """
-    return requests.get(url).text
+    return _fetch(url)
+
+
+def get_pages(urls: List[str]) -> List[str]:
+    """
+    Fetch and cache the content of several URLs at once.
+
+    This function:
+    - Increments every request counter and reads every cached response
+      in a single pipelined round trip
+    - Fetches the missing responses concurrently on a shared thread
+      pool, each worker reusing its own pooled HTTP session
+    - Caches all fresh responses in a second round trip, as one
+      MULTI/EXEC transaction that resets each counter and stores each
+      response with the same 10 second expiration as get_page
+
+    Args:
+        urls: The URLs to fetch
+
+    Returns:
+        List[str]: The text content of each URL, in the order given
+
+    Raises:
+        requests.RequestException: The first fetch error, raised after
+            every page that was fetched successfully has been cached
+
+    Note:
+        Every occurrence of a URL increments its counter, but a missed
+        URL is fetched and its counter reset to 0 only once, so a URL
+        listed twice is not counted like two get_page calls
+    """
+    if not urls:
+        return []
+    with redis_store.pipeline(transaction=False) as pipe:
+        for url in urls:
+            pipe.incr(f'count:{url}')
+        pipe.mget([f'result:{url}' for url in urls])
+        cached = pipe.execute()[-1]
+    pages: Dict[str, str] = {
+        url: result.decode('utf-8')
+        for url, result in zip(urls, cached) if result
+    }
+    misses = [url for url in dict.fromkeys(urls) if url not in pages]
+    if misses:
+        futures = [_fetch_pool.submit(_fetch_in_thread, url) for url in misses]
+        fetched: Dict[str, str] = {}
+        error: Optional[BaseException] = None
+        for url, future in zip(misses, futures):
+            try:
+                fetched[url] = future.result()
+            except Exception as exc:
+                error = error or exc
+        with redis_store.pipeline() as pipe:
+            for url, result in fetched.items():
+                pipe.set(f'count:{url}', 0)
+                pipe.set(f'result:{url}', result, ex=10)
+            pipe.execute()
+        if error is not None:
+            raise error
+        pages.update(fetched)
+    return [pages[url] for url in urls]
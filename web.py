@@ -10,22 +10,58 @@ This module implements a caching system that:
 """
 from __future__ import annotations
 
+import os
+import threading
+import time
 import redis
 import requests
+from collections import OrderedDict
 from functools import wraps
-from typing import Callable, Optional, TypeVar, cast
+from requests.adapters import HTTPAdapter
+from typing import Callable, Optional, Tuple, TypeVar, cast
 from dataclasses import dataclass
 from datetime import timedelta
 
 T = TypeVar('T')
 
 
+class _WorkerConnection(redis.Connection):
+    """Redis connection named after the pid of the process opening it."""
+
+    def on_connect(self) -> None:
+        """Set the client name at connect time so forked workers differ."""
+        self.client_name = f"request-cache:{os.getpid()}"
+        super().on_connect()
+
+
+# Connection pool shared by every RequestCache that builds its own client
+redis_pool = redis.BlockingConnectionPool(
+    connection_class=_WorkerConnection,
+    max_connections=32,
+    timeout=5,
+)
+
+
+def _make_session() -> requests.Session:
+    """Build an HTTP session that pools keep-alive connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# HTTP session reusing keep-alive connections across cache misses
+http_session = _make_session()
+
+
 @dataclass
 class CacheConfig:
     """Configuration settings for the caching system."""
     expiration_time: int = 10  # seconds
     prefix_count: str = 'count'
     prefix_result: str = 'result'
+    max_local_entries: int = 128  # in-process results kept per cache
 
 
 class RequestCache:
@@ -40,11 +76,61 @@ class RequestCache:
         Initialize the RequestCache with a Redis client and configuration.
 
         Args:
-            redis_client: Redis client instance. Creates new if None.
+            redis_client: Redis client instance. Creates new on the shared
+                connection pool if None.
             config: Cache configuration settings. Uses defaults if None.
         """
-        self.redis = redis_client or redis.Redis()
+        self.redis = redis_client or redis.Redis(connection_pool=redis_pool)
         self.config = config or CacheConfig()
+        # In-process LRU of decoded results: url -> (expires_at, content)
+        self._local: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        # Guards _local, which every thread using this cache shares
+        self._local_lock = threading.Lock()
+
+    def _get_local(self, url: str) -> Optional[str]:
+        """
+        Retrieve a decoded result from the in-process cache.
+
+        Expired entries are evicted lazily when they are looked up, and
+        a hit marks the entry as most recently used.
+
+        Args:
+            url: The URL to lookup
+
+        Returns:
+            Cached content if present and not expired, None otherwise
+        """
+        with self._local_lock:
+            entry = self._local.get(url)
+            if entry is None:
+                return None
+            expires_at, content = entry
+            if expires_at <= time.monotonic():
+                del self._local[url]
+                return None
+            self._local.move_to_end(url)
+            return content
+
+    def _set_local(self, url: str, content: str, ttl: float) -> None:
+        """
+        Store a decoded result in the in-process cache.
+
+        The least recently used entries are evicted once the cache holds
+        more than max_local_entries results. Like _get_local, this holds
+        the cache lock so concurrent callers cannot interleave.
+
+        Args:
+            url: The URL being cached
+            content: The decoded content to cache
+            ttl: Seconds until the entry expires
+        """
+        if ttl <= 0:
+            return
+        with self._local_lock:
+            self._local[url] = (time.monotonic() + ttl, content)
+            self._local.move_to_end(url)
+            while len(self._local) > self.config.max_local_entries:
+                self._local.popitem(last=False)
 
     def _make_key(self, prefix: str, url: str) -> str:
         """
@@ -86,6 +172,40 @@ class RequestCache:
         result = self.redis.get(key)
         return result.decode('utf-8') if result else None
 
+    def count_and_get(self, url: str) -> Optional[str]:
+        """
+        Increment the request counter and retrieve the cached result.
+
+        A result still held in the in-process cache skips the Redis GET,
+        the payload transfer and the decode, but still costs one blocking
+        round trip for the counter INCR. Otherwise the increment, the
+        read and the remaining TTL are pipelined in a single round trip,
+        and a hit is kept locally until it expires in Redis.
+
+        Args:
+            url: The URL being requested
+
+        Returns:
+            Cached content if available, None otherwise
+        """
+        local_result = self._get_local(url)
+        if local_result is not None:
+            self.increment_count(url)
+            return local_result
+
+        count_key = self._make_key(self.config.prefix_count, url)
+        result_key = self._make_key(self.config.prefix_result, url)
+        with self.redis.pipeline(transaction=False) as pipe:
+            pipe.incr(count_key)
+            pipe.get(result_key)
+            pipe.pttl(result_key)
+            _, result, ttl_ms = pipe.execute()
+        if not result:
+            return None
+        content = result.decode('utf-8')
+        self._set_local(url, content, ttl_ms / 1000)
+        return content
+
     def cache_result(self, url: str, content: str) -> None:
         """
         Cache the result for a URL with expiration.
@@ -97,13 +217,16 @@ class RequestCache:
         count_key = self._make_key(self.config.prefix_count, url)
         result_key = self._make_key(self.config.prefix_result, url)
 
-        # Reset count and store result
-        self.redis.set(count_key, 0)
-        self.redis.setex(
-            result_key,
-            timedelta(seconds=self.config.expiration_time),
-            content
-        )
+        # Reset count and store result in a single round trip
+        with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(count_key, 0)
+            pipe.set(
+                result_key,
+                content,
+                ex=timedelta(seconds=self.config.expiration_time)
+            )
+            pipe.execute()
+        self._set_local(url, content, self.config.expiration_time)
 
 
 def create_cache_decorator(
@@ -139,11 +262,8 @@ def create_cache_decorator(
             Returns:
                 Content from cache or fresh request
             """
-            # Increment request counter
-            cache.increment_count(url)
-
-            # Try to get cached result
-            cached_result = cache.get_cached_result(url)
+            # Increment request counter and try to get cached result
+            cached_result = cache.count_and_get(url)
             if cached_result is not None:
                 return cached_result
 
@@ -177,6 +297,6 @@ def get_page(url: str) -> str:
     Raises:
         requests.RequestException: If the request fails
     """
-    response = requests.get(url)
+    response = http_session.get(url, timeout=5)
     response.raise_for_status()  # Raise exception for bad status codes
     return response.text